@@ -0,0 +1 @@
+"""CFD Signal Provider Bot for EURUSD, GBPUSD, XAUUSD."""
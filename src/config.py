@@ -0,0 +1,240 @@
+"""
+Configuration module for the trading signal bot.
+
+Loads settings from environment variables, applies defaults for optional
+values and validates everything up front so misconfiguration fails fast at
+startup rather than in the middle of a trading session.
+"""
+
+import functools
+import math
+import os
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+
+_DEFAULT_PAIRS: tuple[str, ...] = ("EURUSD", "GBPUSD", "XAUUSD")
+_PAIR_RE = re.compile(r"[^,\s](?:[^,]*[^,\s])?")
+_INT_RE = re.compile(r"[+-]?\d+", re.ASCII)
+_NUMBER_RE = re.compile(r"[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?", re.ASCII)
+
+_ERR_REQUIRED = "{name} environment variable is required"
+_ERR_INVALID_INT = "{name} must be a valid integer, got {raw!r}"
+_ERR_NON_POSITIVE_INT = "{name} must be a positive integer"
+_ERR_INVALID_NUMBER = "{name} must be a valid number, got {raw!r}"
+_ERR_NON_POSITIVE_NUMBER = "{name} must be a positive number"
+
+
+def _required(env: Mapping[str, str], name: str) -> str:
+    """
+    Read a required, non-blank environment variable.
+
+    Args:
+        env: Environment mapping to read from
+        name: Environment variable name
+
+    Returns:
+        str: Value with surrounding whitespace removed
+
+    Raises:
+        ValueError: If the variable is unset or blank
+    """
+    value = env.get(name, "").strip()
+    if not value:
+        raise ValueError(_ERR_REQUIRED.format(name=name))
+    return value
+
+
+def _pairs(env: Mapping[str, str], name: str) -> list[str]:
+    """
+    Read a comma-separated list of trading pairs.
+
+    Entries are split on commas only and trimmed at both ends, so whitespace
+    inside an entry is kept; blank entries are dropped.
+
+    Args:
+        env: Environment mapping to read from
+        name: Environment variable name
+
+    Returns:
+        list[str]: Non-empty pairs, or the default pairs if none are given
+    """
+    return _PAIR_RE.findall(env.get(name, "")) or list(_DEFAULT_PAIRS)
+
+
+def _positive_int(env: Mapping[str, str], name: str, default: str) -> int:
+    """
+    Read an environment variable as a strictly positive integer.
+
+    Args:
+        env: Environment mapping to read from
+        name: Environment variable name
+        default: Value used when the variable is unset
+
+    Returns:
+        int: Parsed value
+
+    Raises:
+        ValueError: If the value is not an integer or is not positive
+    """
+    return _parse_positive_int(env.get(name, default), name)
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_positive_int(raw: str, name: str) -> int:
+    """
+    Parse a strictly positive integer, memoized on the raw string.
+
+    Rebuilding Config from an unchanged environment reuses earlier results.
+    Failures are not cached and raise on every call. Only ASCII digits with
+    an optional sign are accepted, so ``1_000`` is rejected although
+    ``int()`` would allow it.
+
+    Args:
+        raw: Value to parse
+        name: Environment variable name, used in error messages
+
+    Returns:
+        int: Parsed value
+
+    Raises:
+        ValueError: If the value is not an integer or is not positive
+    """
+    if not _INT_RE.fullmatch(raw.strip()):
+        raise ValueError(_ERR_INVALID_INT.format(name=name, raw=raw))
+    value = int(raw)
+    if value <= 0:
+        raise ValueError(_ERR_NON_POSITIVE_INT.format(name=name))
+    return value
+
+
+def _positive_float(env: Mapping[str, str], name: str, default: str) -> float:
+    """
+    Read an environment variable as a strictly positive number.
+
+    Only plain decimal and exponent notation is accepted; ``nan``, ``inf``,
+    underscore digit separators and values that overflow to infinity
+    (e.g. ``1e400``) are rejected.
+
+    Args:
+        env: Environment mapping to read from
+        name: Environment variable name
+        default: Value used when the variable is unset
+
+    Returns:
+        float: Parsed value
+
+    Raises:
+        ValueError: If the value is not a number or is not positive
+    """
+    raw = env.get(name, default)
+    if not _NUMBER_RE.fullmatch(raw.strip()):
+        raise ValueError(_ERR_INVALID_NUMBER.format(name=name, raw=raw))
+    value = float(raw)
+    if not math.isfinite(value):
+        raise ValueError(_ERR_INVALID_NUMBER.format(name=name, raw=raw))
+    if value <= 0:
+        raise ValueError(_ERR_NON_POSITIVE_NUMBER.format(name=name))
+    return value
+
+
+@dataclass(frozen=True, slots=True, init=False, eq=False)
+class Config:
+    """
+    Application configuration loaded from environment variables.
+
+    Attributes cannot be reassigned, so a single instance can be shared
+    between request handlers and threads. Credentials are excluded from
+    ``repr()`` so logging a Config does not leak them, and instances compare
+    and hash by identity.
+
+    Only ``os.environ`` is read. Values from a ``.env`` file are honoured
+    when the configuration is obtained through ``get_config()``, which loads
+    the file first; constructing ``Config()`` directly does not.
+
+    Attributes:
+        API_KEY: Market data provider API key (required)
+        API_SECRET: Market data provider API secret (required)
+        TRADING_PAIRS: Instruments to monitor
+        RISK_REWARD_RATIO: Reward multiple applied to the stop distance
+        MAX_POSITION_SIZE: Upper bound on position size in units
+        STOP_LOSS_PERCENTAGE: Stop loss distance as a percentage of entry
+    """
+
+    API_KEY: str = field(repr=False)
+    API_SECRET: str = field(repr=False)
+    TRADING_PAIRS: list[str]
+    RISK_REWARD_RATIO: int
+    MAX_POSITION_SIZE: int
+    STOP_LOSS_PERCENTAGE: float
+
+    def __init__(self) -> None:
+        """
+        Load and validate configuration from the environment.
+
+        Fields are parsed in declaration order, so the first invalid value
+        determines the error raised.
+
+        Raises:
+            ValueError: If a required variable is missing or a value is invalid
+        """
+        env = os.environ
+        setattr_ = object.__setattr__
+        setattr_(self, "API_KEY", _required(env, "API_KEY"))
+        setattr_(self, "API_SECRET", _required(env, "API_SECRET"))
+        setattr_(self, "TRADING_PAIRS", _pairs(env, "TRADING_PAIRS"))
+        setattr_(
+            self, "RISK_REWARD_RATIO", _positive_int(env, "RISK_REWARD_RATIO", "2")
+        )
+        setattr_(
+            self, "MAX_POSITION_SIZE", _positive_int(env, "MAX_POSITION_SIZE", "1000")
+        )
+        setattr_(
+            self,
+            "STOP_LOSS_PERCENTAGE",
+            _positive_float(env, "STOP_LOSS_PERCENTAGE", "2.0"),
+        )
+
+
+@functools.lru_cache(maxsize=1)
+def get_config() -> Config:
+    """
+    Return the process-wide configuration, parsing the environment once.
+
+    Values from a ``.env`` file are merged into the environment on first
+    call; variables already set in the process take precedence. python-dotenv
+    is imported here rather than at module level so that importing this
+    module stays cheap for code paths that never read configuration.
+
+    Call ``get_config.cache_clear()`` to force a re-read, e.g. in tests.
+
+    Returns:
+        Config: Cached configuration instance
+    """
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    return Config()
+
+
+def __getattr__(name: str) -> Config:
+    """
+    Resolve the ``config`` module attribute on first access.
+
+    ``from src.config import config`` yields the same instance as
+    ``get_config()``. Building it lazily rather than as a module-level
+    ``config = Config()`` keeps the module importable when credentials are
+    not set, e.g. during test collection.
+
+    Args:
+        name: Attribute name being looked up
+
+    Returns:
+        Config: Cached configuration instance for ``config``
+
+    Raises:
+        AttributeError: For any other attribute name
+    """
+    if name == "config":
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
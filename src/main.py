@@ -0,0 +1,146 @@
+"""
+Flask application entry point for the trading signal bot.
+
+Exposes the liveness endpoints used by container health checks and load
+balancers. Their payloads are constant, so the response bodies are encoded
+once at import time instead of being serialized on every request.
+"""
+
+import os
+from collections.abc import Callable
+from typing import Any
+
+import orjson
+from flask import Flask, Response
+from flask.json.provider import DefaultJSONProvider, JSONProvider
+
+
+class OrjsonProvider(JSONProvider):
+    """
+    Flask JSON provider backed by orjson instead of the stdlib json module.
+
+    Mirrors DefaultJSONProvider's output: dates, dataclasses, ``Decimal``
+    and ``__html__`` objects go through the same fallback (dates become
+    HTTP dates), and dict keys are sorted unless ``sort_keys`` is disabled.
+    """
+
+    default: Callable[[Any], Any] = staticmethod(DefaultJSONProvider.default)
+    """Fallback for objects orjson does not serialize natively."""
+
+    sort_keys = True
+    """Sort the keys in serialized dicts, as DefaultJSONProvider does."""
+
+    def _encode(
+        self,
+        obj: Any,
+        default: Callable[[Any], Any] | None = None,
+        sort_keys: bool | None = None,
+    ) -> bytes:
+        """
+        Serialize an object to UTF-8 JSON bytes.
+
+        Args:
+            obj: Object to serialize
+            default: Fallback serializer, defaults to :attr:`default`
+            sort_keys: Whether to sort dict keys, defaults to :attr:`sort_keys`
+
+        Returns:
+            bytes: JSON document
+
+        Raises:
+            TypeError: If the object cannot be serialized
+        """
+        if sort_keys is None:
+            sort_keys = self.sort_keys
+        option = orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=default or self.default, option=option)
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """
+        Serialize an object to a JSON string.
+
+        orjson is stricter than the stdlib encoder: dict keys must be
+        strings and integers must fit in 64 bits, otherwise ``TypeError`` is
+        raised. Of the stdlib ``json.dumps`` options only ``default`` and
+        ``sort_keys`` are honoured; the others, such as ``indent``, are
+        accepted for JSONProvider compatibility but have no effect.
+
+        Args:
+            obj: Object to serialize
+            **kwargs: stdlib ``json.dumps`` options
+
+        Returns:
+            str: JSON document
+
+        Raises:
+            TypeError: If the object cannot be serialized
+        """
+        return self._encode(
+            obj, kwargs.get("default"), kwargs.get("sort_keys")
+        ).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        """
+        Deserialize a JSON document.
+
+        Args:
+            s: JSON text or UTF-8 bytes
+            **kwargs: Ignored; accepted for JSONProvider compatibility
+
+        Returns:
+            Any: Decoded object
+        """
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        """
+        Build a JSON response, writing orjson's bytes output directly.
+
+        Args:
+            *args: A single value, or several values serialized as a list
+            **kwargs: Values serialized as an object
+
+        Returns:
+            Response: Response with the ``application/json`` mimetype
+        """
+        obj = self._prepare_response_obj(args, kwargs)
+        # JSONProvider types _app as the sansio App; at runtime it is a Flask
+        # app whose response_class is a flask.Response subclass.
+        response_class: type[Response]
+        response_class = self._app.response_class  # type: ignore[assignment]
+        return response_class(self._encode(obj), mimetype="application/json")
+
+
+app = Flask(__name__)
+app.json = OrjsonProvider(app)
+
+_HEALTH_BODY = b'{"status":"healthy","service":"trading-signal-bot"}'
+_INDEX_BODY = b"Trading Signal Bot is running"
+
+
+@app.get("/health")
+def health() -> Response:
+    """
+    Report service liveness.
+
+    Returns:
+        Response: JSON body ``{"status": "healthy", "service": ...}``
+    """
+    return Response(_HEALTH_BODY, 200, mimetype="application/json")
+
+
+@app.get("/")
+def index() -> Response:
+    """
+    Return a plain-text welcome message.
+
+    Returns:
+        Response: Static text body
+    """
+    return Response(_INDEX_BODY, 200, mimetype="text/plain")
+
+
+if __name__ == "__main__":
+    app.run(port=int(os.getenv("FLASK_PORT", "8080")))
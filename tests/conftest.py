@@ -0,0 +1,109 @@
+"""
+Shared pytest fixtures for the Flask application tests.
+
+The application holds no per-request state, so a single configured app and
+test client are built once per session and reused by every test module.
+"""
+
+import os
+import tempfile
+import time
+from typing import Any, Generator
+
+import pytest
+from flask import Flask
+from flask.testing import FlaskClient
+
+_PROFILE_FLAG_VALUES = frozenset({"1", "true", "yes", "on"})
+_DEFAULT_PROFILE_DIR = os.path.join(tempfile.gettempdir(), "profiles")
+
+
+def _profile_filename(environ: dict[str, Any]) -> str:
+    """
+    Build a unique ``.prof`` filename for one profiled request.
+
+    Werkzeug's default name only has one-second resolution, so requests to
+    the same path within a second, or from different xdist workers, would
+    overwrite each other's profiles.
+
+    Args:
+        environ: WSGI environment of the profiled request
+
+    Returns:
+        str: Filename of the form ``{method}.{path}.{worker}.{ns}.prof``
+    """
+    path = environ["PATH_INFO"].strip("/").replace("/", ".") or "root"
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "master")
+    return f"{environ['REQUEST_METHOD']}.{path}.{worker}.{time.time_ns()}.prof"
+
+
+# ============================================================================
+# 🏗️ TEST FIXTURES
+# ============================================================================
+
+
+@pytest.fixture(scope="session")
+def app() -> Generator[Flask, None, None]:
+    """
+    Create and configure a test Flask application instance.
+
+    Session-scoped: the application is stateless, so one configured
+    instance is shared by every test.
+
+    Set ``PROFILE_TESTS=1`` to wrap the app in Werkzeug's
+    ProfilerMiddleware; every request made by the tests then writes a
+    cProfile ``.prof`` file for snakeviz/tuna to ``PROFILE_TESTS_DIR``
+    (default ``profiles`` under the system temp directory). Nothing is
+    printed to stdout.
+
+    Yields:
+        Flask: Configured test application instance
+    """
+    from src.main import app as flask_app
+
+    flask_app.config.update(
+        {
+            "TESTING": True,
+            "DEBUG": False,
+        }
+    )
+
+    if os.environ.get("PROFILE_TESTS", "").lower() not in _PROFILE_FLAG_VALUES:
+        yield flask_app
+        return
+
+    from werkzeug.middleware.profiler import ProfilerMiddleware
+
+    profile_dir = os.environ.get("PROFILE_TESTS_DIR", _DEFAULT_PROFILE_DIR)
+    os.makedirs(profile_dir, exist_ok=True)
+    original_wsgi_app = flask_app.wsgi_app
+    flask_app.wsgi_app = ProfilerMiddleware(  # type: ignore[method-assign]
+        original_wsgi_app,
+        stream=None,
+        profile_dir=profile_dir,
+        filename_format=_profile_filename,  # type: ignore[arg-type]
+    )
+    try:
+        yield flask_app
+    finally:
+        flask_app.wsgi_app = original_wsgi_app  # type: ignore[method-assign]
+
+
+@pytest.fixture(scope="session")
+def client(app: Flask) -> Generator[FlaskClient, None, None]:
+    """
+    Create a test client for the Flask application.
+
+    Session-scoped so the client is built once and reused across tests.
+    The client is entered as a context manager inside a long-lived
+    application context, so each request reuses that app context instead
+    of pushing and popping its own.
+
+    Args:
+        app: Flask application instance
+
+    Yields:
+        FlaskClient: Test client for making requests
+    """
+    with app.test_client() as test_client, app.app_context():
+        yield test_client
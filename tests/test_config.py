@@ -11,20 +11,34 @@ Tests cover:
 """
 
 import os
-from typing import Any
-from unittest.mock import patch
+from collections.abc import Iterator
+from dataclasses import FrozenInstanceError
 
 import pytest
 
-from src.config import Config
+import src.config
+from src.config import Config, get_config
+
+_LONG_PAIRS = ",".join(f"PAIR{i}" for i in range(100))
+_CONFIG_VARS = (
+    "API_KEY",
+    "API_SECRET",
+    "TRADING_PAIRS",
+    "RISK_REWARD_RATIO",
+    "MAX_POSITION_SIZE",
+    "STOP_LOSS_PERCENTAGE",
+)
+
+
+def _set(**env: str) -> None:
+    """Set several environment variables for the duration of a test."""
+    os.environ.update(env)
 
 
 class TestConfigInitialization:
     """Test suite for Config class initialization and environment variable loading."""
 
-    def test_config_loads_all_required_environment_variables(
-        self, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
+    def test_config_loads_all_required_environment_variables(self) -> None:
         """Test that Config successfully loads all required environment variables."""
         # Arrange
         env_vars = {
@@ -35,8 +49,7 @@ class TestConfigInitialization:
             "MAX_POSITION_SIZE": "1000",
             "STOP_LOSS_PERCENTAGE": "2.5",
         }
-        for key, value in env_vars.items():
-            monkeypatch.setenv(key, value)
+        _set(**env_vars)
 
         # Act
         config = Config()
@@ -49,13 +62,10 @@ class TestConfigInitialization:
         assert config.MAX_POSITION_SIZE == 1000
         assert config.STOP_LOSS_PERCENTAGE == 2.5
 
-    def test_config_applies_default_values_when_optional_vars_missing(
-        self, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
+    def test_config_applies_default_values_when_optional_vars_missing(self) -> None:
         """Test that Config applies default values for optional environment variables."""
         # Arrange
-        monkeypatch.setenv("API_KEY", "test_key")
-        monkeypatch.setenv("API_SECRET", "test_secret")
+        _set(API_KEY="test_key", API_SECRET="test_secret")
 
         # Act
         config = Config()
@@ -66,25 +76,19 @@ class TestConfigInitialization:
         assert config.MAX_POSITION_SIZE == 1000
         assert config.STOP_LOSS_PERCENTAGE == 2.0
 
-    def test_config_raises_value_error_when_api_key_missing(
-        self, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
+    def test_config_raises_value_error_when_api_key_missing(self) -> None:
         """Test that Config raises ValueError when API_KEY is not set."""
         # Arrange
-        monkeypatch.delenv("API_KEY", raising=False)
-        monkeypatch.setenv("API_SECRET", "test_secret")
+        _set(API_SECRET="test_secret")
 
         # Act & Assert
         with pytest.raises(ValueError, match="API_KEY environment variable is required"):
             Config()
 
-    def test_config_raises_value_error_when_api_secret_missing(
-        self, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
+    def test_config_raises_value_error_when_api_secret_missing(self) -> None:
         """Test that Config raises ValueError when API_SECRET is not set."""
         # Arrange
-        monkeypatch.setenv("API_KEY", "test_key")
-        monkeypatch.delenv("API_SECRET", raising=False)
+        _set(API_KEY="test_key")
 
         # Act & Assert
         with pytest.raises(
@@ -92,14 +96,8 @@ class TestConfigInitialization:
         ):
             Config()
 
-    def test_config_raises_value_error_when_both_credentials_missing(
-        self, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
+    def test_config_raises_value_error_when_both_credentials_missing(self) -> None:
         """Test that Config raises ValueError when both API credentials are missing."""
-        # Arrange
-        monkeypatch.delenv("API_KEY", raising=False)
-        monkeypatch.delenv("API_SECRET", raising=False)
-
         # Act & Assert
         with pytest.raises(ValueError, match="API_KEY environment variable is required"):
             Config()
@@ -108,14 +106,14 @@ class TestConfigInitialization:
 class TestConfigTradingPairs:
     """Test suite for TRADING_PAIRS configuration."""
 
-    def test_trading_pairs_returns_list_from_comma_separated_string(
-        self, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
+    def test_trading_pairs_returns_list_from_comma_separated_string(self) -> None:
         """Test that TRADING_PAIRS correctly parses comma-separated string."""
         # Arrange
-        monkeypatch.setenv("API_KEY", "test_key")
-        monkeypatch.setenv("API_SECRET", "test_secret")
-        monkeypatch.setenv("TRADING_PAIRS", "EURUSD,GBPUSD,XAUUSD")
+        _set(
+            API_KEY="test_key",
+            API_SECRET="test_secret",
+            TRADING_PAIRS="EURUSD,GBPUSD,XAUUSD",
+        )
 
         # Act
         config = Config()
@@ -124,14 +122,14 @@ class TestConfigTradingPairs:
         assert isinstance(config.TRADING_PAIRS, list)
         assert config.TRADING_PAIRS == ["EURUSD", "GBPUSD", "XAUUSD"]
 
-    def test_trading_pairs_handles_whitespace_in_values(
-        self, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
+    def test_trading_pairs_handles_whitespace_in_values(self) -> None:
         """Test that TRADING_PAIRS strips whitespace from values."""
         # Arrange
-        monkeypatch.setenv("API_KEY", "test_key")
-        monkeypatch.setenv("API_SECRET", "test_secret")
-        monkeypatch.setenv("TRADING_PAIRS", " EURUSD , GBPUSD , XAUUSD ")
+        _set(
+            API_KEY="test_key",
+            API_SECRET="test_secret",
+            TRADING_PAIRS=" EURUSD , GBPUSD , XAUUSD ",
+        )
 
         # Act
         config = Config()
@@ -139,281 +137,210 @@ class TestConfigTradingPairs:
         # Assert
         assert config.TRADING_PAIRS == ["EURUSD", "GBPUSD", "XAUUSD"]
 
-    def test_trading_pairs_handles_single_pair(
-        self, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        """Test that TRADING_PAIRS handles single trading pair correctly."""
+    def test_trading_pairs_splits_only_on_commas(self) -> None:
+        """Test that TRADING_PAIRS keeps whitespace inside a value."""
         # Arrange
-        monkeypatch.setenv("API_KEY", "test_key")
-        monkeypatch.setenv("API_SECRET", "test_secret")
-        monkeypatch.setenv("TRADING_PAIRS", "EURUSD")
+        _set(
+            API_KEY="test_key",
+            API_SECRET="test_secret",
+            TRADING_PAIRS=" EUR USD ,GBPUSD XAUUSD,, ",
+        )
 
         # Act
         config = Config()
 
         # Assert
-        assert config.TRADING_PAIRS == ["EURUSD"]
+        assert config.TRADING_PAIRS == ["EUR USD", "GBPUSD XAUUSD"]
 
-    def test_trading_pairs_handles_empty_string(
-        self, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        """Test that TRADING_PAIRS handles empty string by using default."""
+    def test_trading_pairs_handles_single_pair(self) -> None:
+        """Test that TRADING_PAIRS handles single trading pair correctly."""
         # Arrange
-        monkeypatch.setenv("API_KEY", "test_key")
-        monkeypatch.setenv("API_SECRET", "test_secret")
-        monkeypatch.setenv("TRADING_PAIRS", "")
+        _set(
+            API_KEY="test_key",
+            API_SECRET="test_secret",
+            TRADING_PAIRS="EURUSD",
+        )
 
         # Act
         config = Config()
 
         # Assert
-        assert config.TRADING_PAIRS == ["EURUSD", "GBPUSD", "XAUUSD"]
+        assert config.TRADING_PAIRS == ["EURUSD"]
 
-    def test_trading_pairs_filters_empty_values(
-        self, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        """Test that TRADING_PAIRS filters out empty values from comma-separated list."""
+    def test_trading_pairs_handles_empty_string(self) -> None:
+        """Test that TRADING_PAIRS handles empty string by using default."""
         # Arrange
-        monkeypatch.setenv("API_KEY", "test_key")
-        monkeypatch.setenv("API_SECRET", "test_secret")
-        monkeypatch.setenv("TRADING_PAIRS", "EURUSD,,GBPUSD,")
+        _set(
+            API_KEY="test_key",
+            API_SECRET="test_secret",
+            TRADING_PAIRS="",
+        )
 
         # Act
         config = Config()
 
         # Assert
-        assert config.TRADING_PAIRS == ["EURUSD", "GBPUSD"]
-
-
-class TestConfigRiskRewardRatio:
-    """Test suite for RISK_REWARD_RATIO configuration."""
+        assert config.TRADING_PAIRS == ["EURUSD", "GBPUSD", "XAUUSD"]
 
-    def test_risk_reward_ratio_converts_string_to_integer(
-        self, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        """Test that RISK_REWARD_RATIO converts string to integer."""
+    def test_trading_pairs_filters_empty_values(self) -> None:
+        """Test that TRADING_PAIRS filters out empty values from comma-separated list."""
         # Arrange
-        monkeypatch.setenv("API_KEY", "test_key")
-        monkeypatch.setenv("API_SECRET", "test_secret")
-        monkeypatch.setenv("RISK_REWARD_RATIO", "3")
+        _set(
+            API_KEY="test_key",
+            API_SECRET="test_secret",
+            TRADING_PAIRS="EURUSD,,GBPUSD,",
+        )
 
         # Act
         config = Config()
 
         # Assert
-        assert isinstance(config.RISK_REWARD_RATIO, int)
-        assert config.RISK_REWARD_RATIO == 3
-
-    def test_risk_reward_ratio_validates_positive_integer(
-        self, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        """Test that RISK_REWARD_RATIO validates positive integer values."""
-        # Arrange
-        monkeypatch.setenv("API_KEY", "test_key")
-        monkeypatch.setenv("API_SECRET", "test_secret")
-        monkeypatch.setenv("RISK_REWARD_RATIO", "-1")
-
-        # Act & Assert
-        with pytest.raises(
-            ValueError, match="RISK_REWARD_RATIO must be a positive integer"
-        ):
-            Config()
-
-    def test_risk_reward_ratio_rejects_zero(
-        self, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        """Test that RISK_REWARD_RATIO rejects zero value."""
-        # Arrange
-        monkeypatch.setenv("API_KEY", "test_key")
-        monkeypatch.setenv("API_SECRET", "test_secret")
-        monkeypatch.setenv("RISK_REWARD_RATIO", "0")
-
-        # Act & Assert
-        with pytest.raises(
-            ValueError, match="RISK_REWARD_RATIO must be a positive integer"
-        ):
-            Config()
-
-    def test_risk_reward_ratio_rejects_non_numeric_string(
-        self, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        """Test that RISK_REWARD_RATIO rejects non-numeric string values."""
-        # Arrange
-        monkeypatch.setenv("API_KEY", "test_key")
-        monkeypatch.setenv("API_SECRET", "test_secret")
-        monkeypatch.setenv("RISK_REWARD_RATIO", "invalid")
-
-        # Act & Assert
-        with pytest.raises(ValueError, match="RISK_REWARD_RATIO must be a valid integer"):
-            Config()
-
-    def test_risk_reward_ratio_rejects_float_string(
-        self, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        """Test that RISK_REWARD_RATIO rejects float string values."""
-        # Arrange
-        monkeypatch.setenv("API_KEY", "test_key")
-        monkeypatch.setenv("API_SECRET", "test_secret")
-        monkeypatch.setenv("RISK_REWARD_RATIO", "2.5")
-
-        # Act & Assert
-        with pytest.raises(ValueError, match="RISK_REWARD_RATIO must be a valid integer"):
-            Config()
+        assert config.TRADING_PAIRS == ["EURUSD", "GBPUSD"]
 
 
-class TestConfigMaxPositionSize:
-    """Test suite for MAX_POSITION_SIZE configuration."""
-
-    def test_max_position_size_converts_string_to_integer(
-        self, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        """Test that MAX_POSITION_SIZE converts string to integer."""
-        # Arrange
-        monkeypatch.setenv("API_KEY", "test_key")
-        monkeypatch.setenv("API_SECRET", "test_secret")
-        monkeypatch.setenv("MAX_POSITION_SIZE", "5000")
+class TestConfigNumericFields:
+    """Test suite for RISK_REWARD_RATIO, MAX_POSITION_SIZE and STOP_LOSS_PERCENTAGE."""
+
+    @pytest.mark.parametrize(
+        "env_var,value,expected,expected_type",
+        [
+            pytest.param("RISK_REWARD_RATIO", "3", 3, int, id="risk_reward_int"),
+            pytest.param("MAX_POSITION_SIZE", "5000", 5000, int, id="max_position_int"),
+            pytest.param(
+                "STOP_LOSS_PERCENTAGE", "3.5", 3.5, float, id="stop_loss_float"
+            ),
+            pytest.param(
+                "STOP_LOSS_PERCENTAGE", "5", 5.0, float, id="stop_loss_int_string"
+            ),
+        ],
+    )
+    def test_numeric_field_conversion(
+        self,
+        valid_config_env: dict[str, str],
+        env_var: str,
+        value: str,
+        expected: int | float,
+        expected_type: type,
+    ) -> None:
+        """Test that numeric fields convert string values to the right type."""
+        # Arrange
+        _set(**{env_var: value})
 
         # Act
         config = Config()
 
         # Assert
-        assert isinstance(config.MAX_POSITION_SIZE, int)
-        assert config.MAX_POSITION_SIZE == 5000
-
-    def test_max_position_size_validates_positive_integer(
-        self, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        """Test that MAX_POSITION_SIZE validates positive integer values."""
-        # Arrange
-        monkeypatch.setenv("API_KEY", "test_key")
-        monkeypatch.setenv("API_SECRET", "test_secret")
-        monkeypatch.setenv("MAX_POSITION_SIZE", "-100")
+        assert isinstance(getattr(config, env_var), expected_type)
+        assert getattr(config, env_var) == expected
+
+    @pytest.mark.parametrize(
+        "env_var,value,match",
+        [
+            ("RISK_REWARD_RATIO", "-1", "RISK_REWARD_RATIO must be a positive integer"),
+            ("RISK_REWARD_RATIO", "0", "RISK_REWARD_RATIO must be a positive integer"),
+            (
+                "RISK_REWARD_RATIO",
+                "invalid",
+                "RISK_REWARD_RATIO must be a valid integer",
+            ),
+            ("RISK_REWARD_RATIO", "2.5", "RISK_REWARD_RATIO must be a valid integer"),
+            (
+                "MAX_POSITION_SIZE",
+                "-100",
+                "MAX_POSITION_SIZE must be a positive integer",
+            ),
+            ("MAX_POSITION_SIZE", "0", "MAX_POSITION_SIZE must be a positive integer"),
+            (
+                "STOP_LOSS_PERCENTAGE",
+                "-1.5",
+                "STOP_LOSS_PERCENTAGE must be a positive number",
+            ),
+            (
+                "STOP_LOSS_PERCENTAGE",
+                "0",
+                "STOP_LOSS_PERCENTAGE must be a positive number",
+            ),
+            (
+                "STOP_LOSS_PERCENTAGE",
+                "invalid",
+                "STOP_LOSS_PERCENTAGE must be a valid number",
+            ),
+            (
+                "STOP_LOSS_PERCENTAGE",
+                "nan",
+                "STOP_LOSS_PERCENTAGE must be a valid number",
+            ),
+            (
+                "STOP_LOSS_PERCENTAGE",
+                "inf",
+                "STOP_LOSS_PERCENTAGE must be a valid number",
+            ),
+            (
+                "STOP_LOSS_PERCENTAGE",
+                "1e400",
+                "STOP_LOSS_PERCENTAGE must be a valid number",
+            ),
+        ],
+    )
+    def test_numeric_field_validation(
+        self,
+        valid_config_env: dict[str, str],
+        env_var: str,
+        value: str,
+        match: str,
+    ) -> None:
+        """Test that numeric fields reject malformed, zero and negative values."""
+        # Arrange
+        _set(**{env_var: value})
 
         # Act & Assert
-        with pytest.raises(
-            ValueError, match="MAX_POSITION_SIZE must be a positive integer"
-        ):
+        with pytest.raises(ValueError, match=match):
             Config()
 
-    def test_max_position_size_rejects_zero(
-        self, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        """Test that MAX_POSITION_SIZE rejects zero value."""
-        # Arrange
-        monkeypatch.setenv("API_KEY", "test_key")
-        monkeypatch.setenv("API_SECRET", "test_secret")
-        monkeypatch.setenv("MAX_POSITION_SIZE", "0")
+    @pytest.mark.parametrize(
+        "env_var,value,match",
+        [
+            ("RISK_REWARD_RATIO", "1_000", "RISK_REWARD_RATIO must be a valid integer"),
+            ("MAX_POSITION_SIZE", "1_000", "MAX_POSITION_SIZE must be a valid integer"),
+            (
+                "STOP_LOSS_PERCENTAGE",
+                "1_0.5",
+                "STOP_LOSS_PERCENTAGE must be a valid number",
+            ),
+        ],
+    )
+    def test_numeric_field_rejects_underscore_separators(
+        self,
+        valid_config_env: dict[str, str],
+        env_var: str,
+        value: str,
+        match: str,
+    ) -> None:
+        """Test that digit-group underscores are rejected although int() accepts them."""
+        # Arrange
+        _set(**{env_var: value})
 
         # Act & Assert
-        with pytest.raises(
-            ValueError, match="MAX_POSITION_SIZE must be a positive integer"
-        ):
+        with pytest.raises(ValueError, match=match):
             Config()
 
 
-class TestConfigStopLossPercentage:
-    """Test suite for STOP_LOSS_PERCENTAGE configuration."""
-
-    def test_stop_loss_percentage_converts_string_to_float(
-        self, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        """Test that STOP_LOSS_PERCENTAGE converts string to float."""
-        # Arrange
-        monkeypatch.setenv("API_KEY", "test_key")
-        monkeypatch.setenv("API_SECRET", "test_secret")
-        monkeypatch.setenv("STOP_LOSS_PERCENTAGE", "3.5")
-
-        # Act
-        config = Config()
-
-        # Assert
-        assert isinstance(config.STOP_LOSS_PERCENTAGE, float)
-        assert config.STOP_LOSS_PERCENTAGE == 3.5
-
-    def test_stop_loss_percentage_validates_positive_value(
-        self, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        """Test that STOP_LOSS_PERCENTAGE validates positive values."""
-        # Arrange
-        monkeypatch.setenv("API_KEY", "test_key")
-        monkeypatch.setenv("API_SECRET", "test_secret")
-        monkeypatch.setenv("STOP_LOSS_PERCENTAGE", "-1.5")
-
-        # Act & Assert
-        with pytest.raises(
-            ValueError, match="STOP_LOSS_PERCENTAGE must be a positive number"
-        ):
-            Config()
-
-    def test_stop_loss_percentage_rejects_zero(
-        self, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        """Test that STOP_LOSS_PERCENTAGE rejects zero value."""
-        # Arrange
-        monkeypatch.setenv("API_KEY", "test_key")
-        monkeypatch.setenv("API_SECRET", "test_secret")
-        monkeypatch.setenv("STOP_LOSS_PERCENTAGE", "0")
-
-        # Act & Assert
-        with pytest.raises(
-            ValueError, match="STOP_LOSS_PERCENTAGE must be a positive number"
-        ):
-            Config()
-
-    def test_stop_loss_percentage_rejects_non_numeric_string(
-        self, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        """Test that STOP_LOSS_PERCENTAGE rejects non-numeric string values."""
-        # Arrange
-        monkeypatch.setenv("API_KEY", "test_key")
-        monkeypatch.setenv("API_SECRET", "test_secret")
-        monkeypatch.setenv("STOP_LOSS_PERCENTAGE", "invalid")
-
-        # Act & Assert
-        with pytest.raises(
-            ValueError, match="STOP_LOSS_PERCENTAGE must be a valid number"
-        ):
-            Config()
-
-    def test_stop_loss_percentage_handles_integer_string(
-        self, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        """Test that STOP_LOSS_PERCENTAGE handles integer string values."""
-        # Arrange
-        monkeypatch.setenv("API_KEY", "test_key")
-        monkeypatch.setenv("API_SECRET", "test_secret")
-        monkeypatch.setenv("STOP_LOSS_PERCENTAGE", "5")
-
-        # Act
-        config = Config()
-
-        # Assert
-        assert isinstance(config.STOP_LOSS_PERCENTAGE, float)
-        assert config.STOP_LOSS_PERCENTAGE == 5.0
-
-
 class TestConfigEdgeCases:
     """Test suite for edge cases and boundary conditions."""
 
-    def test_config_handles_empty_api_key(
-        self, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
+    def test_config_handles_empty_api_key(self) -> None:
         """Test that Config rejects empty API_KEY."""
         # Arrange
-        monkeypatch.setenv("API_KEY", "")
-        monkeypatch.setenv("API_SECRET", "test_secret")
+        _set(API_KEY="", API_SECRET="test_secret")
 
         # Act & Assert
         with pytest.raises(ValueError, match="API_KEY environment variable is required"):
             Config()
 
-    def test_config_handles_empty_api_secret(
-        self, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
+    def test_config_handles_empty_api_secret(self) -> None:
         """Test that Config rejects empty API_SECRET."""
         # Arrange
-        monkeypatch.setenv("API_KEY", "test_key")
-        monkeypatch.setenv("API_SECRET", "")
+        _set(API_KEY="test_key", API_SECRET="")
 
         # Act & Assert
         with pytest.raises(
@@ -421,26 +348,23 @@ class TestConfigEdgeCases:
         ):
             Config()
 
-    def test_config_handles_whitespace_only_api_key(
-        self, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
+    def test_config_handles_whitespace_only_api_key(self) -> None:
         """Test that Config rejects whitespace-only API_KEY."""
         # Arrange
-        monkeypatch.setenv("API_KEY", "   ")
-        monkeypatch.setenv("API_SECRET", "test_secret")
+        _set(API_KEY="   ", API_SECRET="test_secret")
 
         # Act & Assert
         with pytest.raises(ValueError, match="API_KEY environment variable is required"):
             Config()
 
-    def test_config_handles_very_large_risk_reward_ratio(
-        self, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
+    def test_config_handles_very_large_risk_reward_ratio(self) -> None:
         """Test that Config handles very large RISK_REWARD_RATIO values."""
         # Arrange
-        monkeypatch.setenv("API_KEY", "test_key")
-        monkeypatch.setenv("API_SECRET", "test_secret")
-        monkeypatch.setenv("RISK_REWARD_RATIO", "1000000")
+        _set(
+            API_KEY="test_key",
+            API_SECRET="test_secret",
+            RISK_REWARD_RATIO="1000000",
+        )
 
         # Act
         config = Config()
@@ -448,14 +372,14 @@ class TestConfigEdgeCases:
         # Assert
         assert config.RISK_REWARD_RATIO == 1000000
 
-    def test_config_handles_very_small_stop_loss_percentage(
-        self, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
+    def test_config_handles_very_small_stop_loss_percentage(self) -> None:
         """Test that Config handles very small STOP_LOSS_PERCENTAGE values."""
         # Arrange
-        monkeypatch.setenv("API_KEY", "test_key")
-        monkeypatch.setenv("API_SECRET", "test_secret")
-        monkeypatch.setenv("STOP_LOSS_PERCENTAGE", "0.01")
+        _set(
+            API_KEY="test_key",
+            API_SECRET="test_secret",
+            STOP_LOSS_PERCENTAGE="0.01",
+        )
 
         # Act
         config = Config()
@@ -463,13 +387,13 @@ class TestConfigEdgeCases:
         # Assert
         assert config.STOP_LOSS_PERCENTAGE == 0.01
 
-    def test_config_handles_special_characters_in_credentials(
-        self, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
+    def test_config_handles_special_characters_in_credentials(self) -> None:
         """Test that Config handles special characters in API credentials."""
         # Arrange
-        monkeypatch.setenv("API_KEY", "test_key!@#$%^&*()")
-        monkeypatch.setenv("API_SECRET", "test_secret_+=[]{}|;:',.<>?/")
+        _set(
+            API_KEY="test_key!@#$%^&*()",
+            API_SECRET="test_secret_+=[]{}|;:',.<>?/",
+        )
 
         # Act
         config = Config()
@@ -482,13 +406,10 @@ class TestConfigEdgeCases:
 class TestConfigImmutability:
     """Test suite for configuration immutability and singleton behavior."""
 
-    def test_config_values_are_accessible(
-        self, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
+    def test_config_values_are_accessible(self) -> None:
         """Test that all Config values are accessible after initialization."""
         # Arrange
-        monkeypatch.setenv("API_KEY", "test_key")
-        monkeypatch.setenv("API_SECRET", "test_secret")
+        _set(API_KEY="test_key", API_SECRET="test_secret")
 
         # Act
         config = Config()
@@ -501,13 +422,54 @@ class TestConfigImmutability:
         assert hasattr(config, "MAX_POSITION_SIZE")
         assert hasattr(config, "STOP_LOSS_PERCENTAGE")
 
-    def test_config_creates_new_instance_each_time(
-        self, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
+    def test_config_rejects_attribute_assignment(self) -> None:
+        """Test that Config attributes cannot be reassigned after creation."""
+        # Arrange
+        _set(API_KEY="test_key", API_SECRET="test_secret")
+        config = Config()
+
+        # Act & Assert
+        with pytest.raises(FrozenInstanceError):
+            config.API_KEY = "other_key"  # type: ignore[misc]
+
+    def test_config_repr_hides_credentials(self) -> None:
+        """Test that repr(Config) does not expose API credentials."""
+        # Arrange
+        _set(API_KEY="test_key", API_SECRET="test_secret")
+
+        # Act
+        text = repr(Config())
+
+        # Assert
+        assert "test_key" not in text
+        assert "test_secret" not in text
+        assert "TRADING_PAIRS=" in text
+
+    def test_config_is_hashable(self) -> None:
+        """Test that Config instances hash by identity."""
+        # Arrange
+        _set(API_KEY="test_key", API_SECRET="test_secret")
+        config = Config()
+
+        # Act & Assert
+        assert hash(config) == hash(config)
+        assert config in {config}
+
+    def test_config_has_no_instance_dict(self) -> None:
+        """Test that Config uses __slots__ instead of a per-instance __dict__."""
+        # Arrange
+        _set(API_KEY="test_key", API_SECRET="test_secret")
+
+        # Act
+        config = Config()
+
+        # Assert
+        assert not hasattr(config, "__dict__")
+
+    def test_config_creates_new_instance_each_time(self) -> None:
         """Test that Config creates new instance on each instantiation."""
         # Arrange
-        monkeypatch.setenv("API_KEY", "test_key")
-        monkeypatch.setenv("API_SECRET", "test_secret")
+        _set(API_KEY="test_key", API_SECRET="test_secret")
 
         # Act
         config1 = Config()
@@ -518,17 +480,72 @@ class TestConfigImmutability:
         assert config1.API_KEY == config2.API_KEY
 
 
+class TestGetConfig:
+    """Test suite for the cached get_config() accessor."""
+
+    @pytest.fixture(autouse=True)
+    def reset_cache(self) -> Iterator[None]:
+        """Clear the get_config() cache around each test."""
+        get_config.cache_clear()
+        yield
+        get_config.cache_clear()
+
+    def test_get_config_returns_same_instance(self) -> None:
+        """Test that get_config() parses the environment once and reuses it."""
+        # Arrange
+        _set(API_KEY="test_key", API_SECRET="test_secret")
+
+        # Act
+        config1 = get_config()
+        config2 = get_config()
+
+        # Assert
+        assert config1 is config2
+
+    def test_get_config_cache_clear_rereads_environment(self) -> None:
+        """Test that clearing the cache picks up environment changes."""
+        # Arrange
+        _set(API_KEY="test_key", API_SECRET="test_secret")
+        config1 = get_config()
+        _set(API_KEY="rotated_key")
+
+        # Act
+        get_config.cache_clear()
+        config2 = get_config()
+
+        # Assert
+        assert config1 is not config2
+        assert config2.API_KEY == "rotated_key"
+
+    def test_module_config_attribute_is_cached_instance(self) -> None:
+        """Test that src.config.config resolves to the get_config() instance."""
+        # Arrange
+        _set(API_KEY="test_key", API_SECRET="test_secret")
+
+        # Act
+        from src.config import config
+
+        # Assert
+        assert config is get_config()
+
+    def test_module_unknown_attribute_raises(self) -> None:
+        """Test that unknown module attributes still raise AttributeError."""
+        # Act & Assert
+        with pytest.raises(AttributeError, match="no attribute 'missing'"):
+            _ = src.config.missing
+
+
 class TestConfigTypeConversions:
     """Test suite for type conversion edge cases."""
 
-    def test_config_handles_leading_zeros_in_integers(
-        self, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
+    def test_config_handles_leading_zeros_in_integers(self) -> None:
         """Test that Config handles leading zeros in integer values."""
         # Arrange
-        monkeypatch.setenv("API_KEY", "test_key")
-        monkeypatch.setenv("API_SECRET", "test_secret")
-        monkeypatch.setenv("RISK_REWARD_RATIO", "003")
+        _set(
+            API_KEY="test_key",
+            API_SECRET="test_secret",
+            RISK_REWARD_RATIO="003",
+        )
 
         # Act
         config = Config()
@@ -536,14 +553,14 @@ class TestConfigTypeConversions:
         # Assert
         assert config.RISK_REWARD_RATIO == 3
 
-    def test_config_handles_scientific_notation_in_float(
-        self, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
+    def test_config_handles_scientific_notation_in_float(self) -> None:
         """Test that Config handles scientific notation in float values."""
         # Arrange
-        monkeypatch.setenv("API_KEY", "test_key")
-        monkeypatch.setenv("API_SECRET", "test_secret")
-        monkeypatch.setenv("STOP_LOSS_PERCENTAGE", "2.5e0")
+        _set(
+            API_KEY="test_key",
+            API_SECRET="test_secret",
+            STOP_LOSS_PERCENTAGE="2.5e0",
+        )
 
         # Act
         config = Config()
@@ -551,15 +568,14 @@ class TestConfigTypeConversions:
         # Assert
         assert config.STOP_LOSS_PERCENTAGE == 2.5
 
-    def test_config_handles_very_long_trading_pairs_list(
-        self, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
+    def test_config_handles_very_long_trading_pairs_list(self) -> None:
         """Test that Config handles very long TRADING_PAIRS list."""
         # Arrange
-        monkeypatch.setenv("API_KEY", "test_key")
-        monkeypatch.setenv("API_SECRET", "test_secret")
-        pairs = ",".join([f"PAIR{i}" for i in range(100)])
-        monkeypatch.setenv("TRADING_PAIRS", pairs)
+        _set(
+            API_KEY="test_key",
+            API_SECRET="test_secret",
+            TRADING_PAIRS=_LONG_PAIRS,
+        )
 
         # Act
         config = Config()
@@ -570,23 +586,24 @@ class TestConfigTypeConversions:
         assert config.TRADING_PAIRS[99] == "PAIR99"
 
 
-@pytest.fixture
-def clean_environment(monkeypatch: pytest.MonkeyPatch) -> None:
-    """Fixture to ensure clean environment for each test."""
-    env_vars = [
-        "API_KEY",
-        "API_SECRET",
-        "TRADING_PAIRS",
-        "RISK_REWARD_RATIO",
-        "MAX_POSITION_SIZE",
-        "STOP_LOSS_PERCENTAGE",
-    ]
-    for var in env_vars:
-        monkeypatch.delenv(var, raising=False)
+@pytest.fixture(autouse=True)
+def clean_environment(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """
+    Fixture to ensure clean environment for each test.
+
+    Only the configuration variables are touched: they are unset before the
+    test, anything the test assigned to them is removed afterwards, and
+    monkeypatch then restores their original values.
+    """
+    for name in _CONFIG_VARS:
+        monkeypatch.delenv(name, raising=False)
+    yield
+    for name in _CONFIG_VARS:
+        os.environ.pop(name, None)
 
 
 @pytest.fixture
-def valid_config_env(monkeypatch: pytest.MonkeyPatch) -> dict[str, str]:
+def valid_config_env() -> dict[str, str]:
     """Fixture providing valid configuration environment variables."""
     env_vars = {
         "API_KEY": "test_api_key",
@@ -596,6 +613,5 @@ def valid_config_env(monkeypatch: pytest.MonkeyPatch) -> dict[str, str]:
         "MAX_POSITION_SIZE": "1000",
         "STOP_LOSS_PERCENTAGE": "2.0",
     }
-    for key, value in env_vars.items():
-        monkeypatch.setenv(key, value)
+    _set(**env_vars)
     return env_vars
\ No newline at end of file
@@ -5,51 +5,36 @@ This module provides extensive testing coverage for the main Flask application,
 including health checks, performance validation, and error scenarios.
 """
 
-import time
-from typing import Generator
-
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from decimal import Decimal
+from types import MappingProxyType
+from typing import Any
+
+import orjson
 import pytest
-from flask import Flask
+from flask import Flask, Response
 from flask.testing import FlaskClient
+from pytest_benchmark.fixture import BenchmarkFixture
+from werkzeug.exceptions import MethodNotAllowed
+from werkzeug.test import EnvironBuilder, TestResponse
 
-
-# ============================================================================
-# 🏗️ TEST FIXTURES
-# ============================================================================
-
-
-@pytest.fixture
-def app() -> Generator[Flask, None, None]:
-    """
-    Create and configure a test Flask application instance.
-
-    Yields:
-        Flask: Configured test application instance
-    """
-    from src.main import app as flask_app
-
-    flask_app.config.update(
-        {
-            "TESTING": True,
-            "DEBUG": False,
-        }
-    )
-
-    yield flask_app
+EXPECTED_HEALTH: Mapping[str, str] = MappingProxyType(
+    {"status": "healthy", "service": "trading-signal-bot"}
+)
 
 
-@pytest.fixture
-def client(app: Flask) -> FlaskClient:
+@pytest.fixture(scope="module", autouse=True)
+def _assert_app_built(app: Flask) -> None:
     """
-    Create a test client for the Flask application.
+    Check once per module that the Flask application initialized for testing.
 
     Args:
         app: Flask application instance
-
-    Returns:
-        FlaskClient: Test client for making requests
     """
-    return app.test_client()
+    assert app is not None
+    assert app.config["TESTING"] is True
 
 
 # ============================================================================
@@ -147,9 +132,7 @@ class TestHealthEndpoint:
         response = client.get("/health")
         json_data = response.get_json()
 
-        expected_structure = {"status": "healthy", "service": "trading-signal-bot"}
-
-        assert json_data == expected_structure
+        assert json_data == EXPECTED_HEALTH
 
     @pytest.mark.parametrize(
         "endpoint,expected_status",
@@ -225,77 +208,97 @@ class TestRootEndpoint:
 # ============================================================================
 
 
+def _get_concurrently(app: Flask, path: str, count: int) -> list[TestResponse]:
+    """
+    Issue ``count`` GET requests to ``path`` in parallel threads.
+
+    Each request uses its own test client, since FlaskClient is not safe to
+    share between threads.
+
+    Args:
+        app: Flask application instance
+        path: URL path to request
+        count: Number of requests, one per worker thread
+
+    Returns:
+        list[TestResponse]: Responses in submission order
+    """
+
+    def fetch(_: int) -> TestResponse:
+        return app.test_client().get(path)
+
+    with ThreadPoolExecutor(max_workers=count) as executor:
+        return list(executor.map(fetch, range(count)))
+
+
+@pytest.mark.benchmark(group="endpoints")
 class TestPerformance:
-    """Test suite for application performance validation."""
+    """
+    Test suite for application performance validation.
 
-    def test_health_endpoint_response_time_under_100ms(
-        self, client: FlaskClient
+    These are pytest-benchmark tests and are skipped in regular runs via
+    ``--benchmark-skip`` in addopts. Run them in a dedicated job with
+    ``pytest -n 0 --benchmark-only --no-cov`` (timing is disabled under
+    xdist); add ``--benchmark-autosave --benchmark-compare
+    --benchmark-compare-fail=mean:10%`` to gate on regressions.
+    """
+
+    def test_health_endpoint_latency(
+        self, benchmark: BenchmarkFixture, client: FlaskClient
     ) -> None:
         """
-        Test that health endpoint responds within 100ms.
+        Benchmark a single GET request to the health endpoint.
 
         Given: A running Flask application
-        When: GET request is made to /health endpoint
-        Then: Response time should be less than 100ms
+        When: GET requests are made to /health endpoint over several rounds
+        Then: Requests should succeed with a mean time under 100ms
         """
-        start_time = time.perf_counter()
-        response = client.get("/health")
-        end_time = time.perf_counter()
-
-        response_time_ms = (end_time - start_time) * 1000
+        response = benchmark(client.get, "/health")
 
         assert response.status_code == 200
-        assert (
-            response_time_ms < 100
-        ), f"Response time {response_time_ms:.2f}ms exceeds 100ms threshold"
-
-    def test_root_endpoint_response_time_under_100ms(
-        self, client: FlaskClient
+        if not benchmark.disabled:
+            stats = benchmark.stats
+            assert stats is not None
+            mean_ms = stats.stats.mean * 1000
+            assert mean_ms < 100, f"Mean response time {mean_ms:.2f}ms exceeds 100ms"
+
+    def test_root_endpoint_latency(
+        self, benchmark: BenchmarkFixture, client: FlaskClient
     ) -> None:
         """
-        Test that root endpoint responds within 100ms.
+        Benchmark a single GET request to the root endpoint.
 
         Given: A running Flask application
-        When: GET request is made to / endpoint
-        Then: Response time should be less than 100ms
+        When: GET requests are made to / endpoint over several rounds
+        Then: Requests should succeed with a mean time under 100ms
         """
-        start_time = time.perf_counter()
-        response = client.get("/")
-        end_time = time.perf_counter()
-
-        response_time_ms = (end_time - start_time) * 1000
+        response = benchmark(client.get, "/")
 
         assert response.status_code == 200
-        assert (
-            response_time_ms < 100
-        ), f"Response time {response_time_ms:.2f}ms exceeds 100ms threshold"
-
-    def test_concurrent_health_checks_performance(
-        self, client: FlaskClient
+        if not benchmark.disabled:
+            stats = benchmark.stats
+            assert stats is not None
+            mean_ms = stats.stats.mean * 1000
+            assert mean_ms < 100, f"Mean response time {mean_ms:.2f}ms exceeds 100ms"
+
+    def test_concurrent_health_checks_latency(
+        self, benchmark: BenchmarkFixture, app: Flask
     ) -> None:
         """
-        Test health endpoint performance under concurrent requests.
+        Benchmark a batch of concurrent requests to the health endpoint.
 
         Given: A running Flask application
-        When: Multiple concurrent requests are made to /health endpoint
-        Then: All requests should complete successfully within time limit
+        When: Batches of 10 concurrent requests are made to /health endpoint
+        Then: All requests should succeed with a mean batch time under 500ms
         """
-        num_requests = 10
-        start_time = time.perf_counter()
-
-        responses = [client.get("/health") for _ in range(num_requests)]
+        responses = benchmark(_get_concurrently, app, "/health", 10)
 
-        end_time = time.perf_counter()
-        total_time_ms = (end_time - start_time) * 1000
-
-        # All requests should succeed
         assert all(r.status_code == 200 for r in responses)
-
-        # Average time per request should be reasonable
-        avg_time_ms = total_time_ms / num_requests
-        assert (
-            avg_time_ms < 50
-        ), f"Average response time {avg_time_ms:.2f}ms exceeds 50ms threshold"
+        if not benchmark.disabled:
+            stats = benchmark.stats
+            assert stats is not None
+            mean_ms = stats.stats.mean * 1000
+            assert mean_ms < 500, f"Mean batch time {mean_ms:.2f}ms exceeds 500ms"
 
 
 # ============================================================================
@@ -306,54 +309,22 @@ class TestPerformance:
 class TestApplicationIntegration:
     """Test suite for application-level integration scenarios."""
 
-    def test_application_starts_successfully(self, app: Flask) -> None:
+    def test_multiple_concurrent_health_checks(self, app: Flask) -> None:
         """
-        Test that Flask application initializes successfully.
-
-        Given: Flask application configuration
-        When: Application is created
-        Then: Application should be properly initialized
-        """
-        assert app is not None
-        assert app.config["TESTING"] is True
-
-    def test_multiple_sequential_health_checks(self, client: FlaskClient) -> None:
-        """
-        Test multiple sequential health check requests.
+        Test multiple overlapping health check requests.
 
         Given: A running Flask application
-        When: Multiple sequential GET requests are made to /health
+        When: Multiple GET requests are made to /health at the same time
         Then: All requests should return consistent results
         """
-        responses = [client.get("/health") for _ in range(5)]
+        responses = _get_concurrently(app, "/health", 5)
 
         # All responses should be successful
         assert all(r.status_code == 200 for r in responses)
 
         # All responses should have same structure
         json_responses = [r.get_json() for r in responses]
-        assert all(
-            data == {"status": "healthy", "service": "trading-signal-bot"}
-            for data in json_responses
-        )
-
-    def test_endpoint_availability_after_multiple_requests(
-        self, client: FlaskClient
-    ) -> None:
-        """
-        Test that endpoints remain available after multiple requests.
-
-        Given: A running Flask application
-        When: Multiple requests are made to different endpoints
-        Then: All endpoints should remain responsive
-        """
-        # Make multiple requests to different endpoints
-        for _ in range(10):
-            health_response = client.get("/health")
-            root_response = client.get("/")
-
-            assert health_response.status_code == 200
-            assert root_response.status_code == 200
+        assert all(data == EXPECTED_HEALTH for data in json_responses)
 
 
 # ============================================================================
@@ -361,6 +332,43 @@ class TestApplicationIntegration:
 # ============================================================================
 
 
+def _wsgi_status(app: Flask, environ: dict[str, Any]) -> str:
+    """
+    Call the application's WSGI interface directly and return the status line.
+
+    Args:
+        app: Flask application instance
+        environ: WSGI environment for the request
+
+    Returns:
+        str: Status line passed to start_response, e.g. "405 METHOD NOT ALLOWED"
+    """
+    statuses: list[str] = []
+
+    def start_response(status: str, headers: Any, exc_info: Any = None) -> Any:
+        statuses.append(status)
+        return lambda data: None
+
+    body = app(environ, start_response)
+    if hasattr(body, "close"):
+        body.close()
+    return statuses[0]
+
+
+@pytest.fixture(scope="class")
+def base_environ() -> dict[str, Any]:
+    """
+    Build a WSGI environ for GET /health once per test class.
+
+    Tests copy it and override ``REQUEST_METHOD`` rather than running
+    EnvironBuilder for every request.
+
+    Returns:
+        dict[str, Any]: WSGI environment for the /health endpoint
+    """
+    return EnvironBuilder(path="/health").get_environ()
+
+
 class TestErrorHandling:
     """Test suite for error handling and edge cases."""
 
@@ -379,140 +387,177 @@ class TestErrorHandling:
         """
         Test health endpoint behavior with trailing slash.
 
+        /health is registered without a trailing slash and with Werkzeug's
+        default strict slashes, so /health/ does not match it.
+
         Given: A running Flask application
         When: GET request is made to /health/ with trailing slash
-        Then: Response should handle gracefully
+        Then: Response status code should be 404
         """
         response = client.get("/health/")
-        # Flask may redirect or return 404 depending on configuration
-        assert response.status_code in [200, 301, 308, 404]
 
-    def test_health_endpoint_post_method_not_allowed(
-        self, client: FlaskClient
+        assert response.status_code == 404
+
+    def test_health_endpoint_unsupported_method(
+        self, app: Flask, base_environ: dict[str, Any]
     ) -> None:
         """
-        Test that POST method is not allowed on health endpoint.
+        Test that an unsupported HTTP method returns 405 status.
 
-        Given: A running Flask application
-        When: POST request is made to /health endpoint
-        Then: Response status code should be 405 (Method Not Allowed)
-        """
-        response = client.post("/health")
-        assert response.status_code == 405
+        /health is registered for GET only, so every other method takes the
+        same MethodNotAllowed path in Werkzeug; POST stands in for all of
+        them end to end, while test_health_route_allows_only_get checks
+        each method against the URL map. The request is dispatched straight
+        to the WSGI callable using an environ built once for the class,
+        bypassing the test client.
 
-    def test_health_endpoint_put_method_not_allowed(
-        self, client: FlaskClient
-    ) -> None:
-        """
-        Test that PUT method is not allowed on health endpoint.
+        Args:
+            app: Flask application instance
+            base_environ: Shared WSGI environ for GET /health
 
         Given: A running Flask application
-        When: PUT request is made to /health endpoint
-        Then: Response status code should be 405 (Method Not Allowed)
+        When: POST request is made to /health endpoint
+        Then: Response status code should be 405
         """
-        response = client.put("/health")
-        assert response.status_code == 405
+        environ = dict(base_environ)
+        environ["REQUEST_METHOD"] = "POST"
 
-    def test_health_endpoint_delete_method_not_allowed(
-        self, client: FlaskClient
-    ) -> None:
-        """
-        Test that DELETE method is not allowed on health endpoint.
+        assert _wsgi_status(app, environ).startswith("405")
 
-        Given: A running Flask application
-        When: DELETE request is made to /health endpoint
-        Then: Response status code should be 405 (Method Not Allowed)
+    @pytest.mark.parametrize("method", ["POST", "PUT", "DELETE", "PATCH"])
+    def test_health_route_allows_only_get(self, app: Flask, method: str) -> None:
         """
-        response = client.delete("/health")
-        assert response.status_code == 405
+        Test that the /health route rejects every method except GET.
 
-    @pytest.mark.parametrize(
-        "method",
-        ["POST", "PUT", "DELETE", "PATCH"],
-    )
-    def test_health_endpoint_unsupported_methods(
-        self, client: FlaskClient, method: str
-    ) -> None:
-        """
-        Test that unsupported HTTP methods return 405 status.
+        Resolves the method against the URL map without dispatching a
+        request, so covering all methods costs only routing lookups.
 
         Args:
-            client: Flask test client
+            app: Flask application instance
             method: HTTP method to test
 
-        Given: A running Flask application
-        When: Unsupported HTTP method is used on /health endpoint
-        Then: Response status code should be 405
+        Given: The application's URL map
+        When: /health is matched with a non-GET method
+        Then: Werkzeug should raise MethodNotAllowed
         """
-        response = client.open("/health", method=method)
-        assert response.status_code == 405
+        adapter = app.url_map.bind("localhost")
+
+        with pytest.raises(MethodNotAllowed):
+            adapter.match("/health", method=method)
 
 
 # ============================================================================
-# 🔍 DATA VALIDATION TESTS
+# 🧾 JSON PROVIDER TESTS
 # ============================================================================
 
 
-class TestDataValidation:
-    """Test suite for response data validation."""
+class TestJsonProvider:
+    """Test suite for the orjson-backed Flask JSON provider."""
 
-    def test_health_response_json_is_valid(self, client: FlaskClient) -> None:
+    def test_app_uses_orjson_provider(self, app: Flask) -> None:
         """
-        Test that health endpoint returns valid JSON.
+        Test that the application is configured with the orjson provider.
 
         Given: A running Flask application
-        When: GET request is made to /health endpoint
-        Then: Response should be valid JSON that can be parsed
+        When: The application's JSON provider is inspected
+        Then: It should be an OrjsonProvider instance
         """
-        response = client.get("/health")
-        json_data = response.get_json()
+        from src.main import OrjsonProvider
 
-        assert json_data is not None
-        assert isinstance(json_data, dict)
+        assert isinstance(app.json, OrjsonProvider)
 
-    def test_health_response_field_types(self, client: FlaskClient) -> None:
+    def test_provider_round_trips_data(self, app: Flask) -> None:
         """
-        Test that health response fields have correct types.
+        Test that dumps and loads round-trip a JSON document.
 
-        Given: A running Flask application
-        When: GET request is made to /health endpoint
-        Then: Response fields should have correct data types
+        Given: The orjson JSON provider
+        When: A dict is serialized and parsed back
+        Then: The parsed value should equal the original
         """
-        response = client.get("/health")
-        json_data = response.get_json()
+        data = {"pair": "EURUSD", "ratio": 5, "levels": [1.1, 1.2]}
 
-        assert isinstance(json_data["status"], str)
-        assert isinstance(json_data["service"], str)
+        assert app.json.loads(app.json.dumps(data)) == data
 
-    def test_health_response_no_extra_fields(self, client: FlaskClient) -> None:
+    def test_provider_uses_default_fallbacks(self, app: Flask) -> None:
         """
-        Test that health response contains only expected fields.
+        Test that types outside orjson's native set use Flask's fallback.
 
-        Given: A running Flask application
-        When: GET request is made to /health endpoint
-        Then: Response should contain exactly 2 fields
+        Given: The orjson JSON provider
+        When: A Decimal and a date are serialized
+        Then: They should be encoded as DefaultJSONProvider encodes them
         """
-        response = client.get("/health")
-        json_data = response.get_json()
+        data = {"price": Decimal("1.10"), "at": date(2024, 1, 2)}
+
+        assert app.json.dumps(data) == (
+            '{"at":"Tue, 02 Jan 2024 00:00:00 GMT","price":"1.10"}'
+        )
 
-        assert len(json_data) == 2
-        assert set(json_data.keys()) == {"status", "service"}
+    def test_provider_honours_sort_keys(self, app: Flask) -> None:
+        """
+        Test that dict keys are sorted unless sort_keys is disabled.
+
+        Given: The orjson JSON provider
+        When: A dict is serialized with and without sort_keys
+        Then: Keys should be sorted only when sort_keys is enabled
+        """
+        data = {"b": 1, "a": 2}
+
+        assert app.json.dumps(data) == '{"a":2,"b":1}'
+        assert app.json.dumps(data, sort_keys=False) == '{"b":1,"a":2}'
+
+    def test_provider_builds_json_response(self, app: Flask) -> None:
+        """
+        Test that jsonify produces an application/json response.
 
-    def test_health_response_values_not_empty(self, client: FlaskClient) -> None:
+        Given: The orjson JSON provider
+        When: A response is built from keyword arguments
+        Then: The response should carry the serialized object
         """
-        Test that health response values are not empty.
+        with app.app_context():
+            response = app.json.response(status="ok")
+
+        assert isinstance(response, Response)
+        assert response.mimetype == "application/json"
+        assert response.data == b'{"status":"ok"}'
+
+
+# ============================================================================
+# 🔍 DATA VALIDATION TESTS
+# ============================================================================
+
+
+@pytest.fixture(scope="class")
+def health_json(client: FlaskClient) -> Any:
+    """
+    Fetch and parse the /health response once per test class.
+
+    The raw body is decoded with orjson directly rather than through
+    Response.get_json(), skipping Flask's mimetype check and JSON caching.
+
+    Args:
+        client: Flask test client
+
+    Returns:
+        Any: Parsed JSON body of the health response
+    """
+    return orjson.loads(client.get("/health").data)
+
+
+class TestDataValidation:
+    """Test suite for response data validation."""
+
+    def test_health_response_schema(self, health_json: Any) -> None:
+        """
+        Test that health response is a JSON object of non-empty strings.
 
         Given: A running Flask application
         When: GET request is made to /health endpoint
-        Then: Response field values should not be empty strings
+        Then: Response should be a JSON object with exactly the 'status' and
+            'service' fields, both holding non-empty strings
         """
-        response = client.get("/health")
-        json_data = response.get_json()
-
-        assert json_data["status"] != ""
-        assert json_data["service"] != ""
-        assert len(json_data["status"]) > 0
-        assert len(json_data["service"]) > 0
+        assert isinstance(health_json, dict)
+        assert set(health_json) == {"status", "service"}
+        assert all(isinstance(v, str) and v for v in health_json.values())
 
 
 # ============================================================================
@@ -548,54 +593,3 @@ class TestSmokeTests:
 
         assert json_data["status"] == "healthy"
         assert "service" in json_data
-
-
-# ============================================================================
-# 📊 TEST METRICS AND COVERAGE
-# ============================================================================
-
-
-def test_coverage_marker() -> None:
-    """
-    Marker test to ensure test file is discovered.
-
-    This test ensures the test suite is properly configured and discoverable
-    by pytest. It serves as a sanity check for the test infrastructure.
-    """
-    assert True, "Test suite is properly configured"
-```
-
-## 📊 Test Suite Summary
-
-### Coverage Breakdown:
-- ✅ **Unit Tests**: 25+ tests covering all endpoints
-- ✅ **Integration Tests**: Application-level workflow validation
-- ✅ **Performance Tests**: Response time validation (<100ms)
-- ✅ **Error Handling**: HTTP method validation, 404 handling
-- ✅ **Data Validation**: JSON structure and type checking
-- ✅ **Smoke Tests**: Critical deployment validation
-
-### Key Features:
-1. **🎯 High Coverage**: >90% code coverage for main.py
-2. **⚡ Performance Validation**: Response time thresholds
-3. **🛡️ Error Scenarios**: Comprehensive error handling tests
-4. **📝 Clear Documentation**: Detailed docstrings for all tests
-5. **🔄 Parameterized Tests**: Efficient test case coverage
-6. **🎭 Test Isolation**: Independent, repeatable tests
-7. **🏗️ AAA Pattern**: Arrange-Act-Assert structure
-8. **🔍 Type Hints**: Full type annotation coverage
-
-### Test Execution:
-```bash
-# Run all tests
-pytest tests/test_main.py -v
-
-# Run with coverage
-pytest tests/test_main.py --cov=src --cov-report=term-missing
-
-# Run only smoke tests
-pytest tests/test_main.py -m smoke
-
-# Run with performance metrics
-pytest tests/test_main.py --durations=10
-```
\ No newline at end of file